@@ -1,7 +1,75 @@
 """Compute the diamond norm between two quantum channels."""
+import functools
+import math
+import warnings
+
 import cvxpy
 import numpy as np
 
+from scipy import sparse
+
+
+@functools.lru_cache()
+def _build_problem(
+    dim: int,
+    re_pattern: tuple[tuple[int, ...], tuple[int, ...]],
+    im_pattern: tuple[tuple[int, ...], tuple[int, ...]],
+) -> tuple[cvxpy.Problem, cvxpy.Parameter, cvxpy.Parameter]:
+    """Construct the diamond norm SDP for the given dimension and sparsity patterns.
+
+    The problem is parameterized by the difference of Choi matrices, so it is
+    cached and reused across calls; only the parameter values change. The cache
+    key includes the sparsity patterns since they are fixed at construction
+    time.
+
+    :param dim: The dimension of the channel input/output space.
+    :param re_pattern: (rows, cols) of the nonzero entries of the real part of
+                       the Choi difference.
+    :param im_pattern: (rows, cols) of the nonzero entries of the imaginary
+                       part of the Choi difference.
+    :return: The compiled problem along with its real- and imaginary-part
+             Choi-difference parameters.
+    """
+    dim_squared = dim**2
+
+    # Enforce that variable is density operator. Declaring the variables as
+    # Hermitian bakes the symmetry into their parameterization, which halves
+    # the number of free variables handed to the solver compared to a full
+    # complex matrix with an explicit equality constraint.
+    rho = cvxpy.Variable((dim, dim), hermitian=True)
+    constraints = [rho >> 0]
+    constraints += [cvxpy.trace(rho) == 1]
+
+    # Variable must be Hermitian and positive-semidefinite.
+    w_var = cvxpy.Variable((dim_squared, dim_squared), hermitian=True)
+    constraints += [w_var >> 0]
+
+    # The operator I ⊗ rho is block-diagonal with `rho` repeated along the
+    # diagonal. Assembling it with bmat avoids `cvxpy.kron`, whose
+    # canonicalization densifies the Kronecker lift.
+    zero_block = np.zeros((dim, dim))
+    identity_kron_rho = cvxpy.bmat(
+        [[rho if i == j else zero_block for j in range(dim)] for i in range(dim)]
+    )
+    constraints += [(w_var - identity_kron_rho) << 0]
+
+    # The difference of two Choi matrices is typically sparse, so declare the
+    # parameters with the sparsity patterns of `delta_choi`. This keeps the
+    # cost of canonicalization proportional to the number of nonzero entries
+    # rather than to dim**4.
+    j_re = cvxpy.Parameter((dim_squared, dim_squared), sparsity=re_pattern)
+    j_im = cvxpy.Parameter((dim_squared, dim_squared), sparsity=im_pattern)
+
+    # With J and W Hermitian, Re(Tr(J^H W)) = sum(Re(J) ⊙ Re(W)) +
+    # sum(Im(J) ⊙ Im(W)). The element-wise real form avoids complex adjoint
+    # nodes in the objective and only touches the nonzero parameter entries.
+    objective = cvxpy.Maximize(
+        cvxpy.sum(cvxpy.multiply(j_re, cvxpy.real(w_var)))
+        + cvxpy.sum(cvxpy.multiply(j_im, cvxpy.imag(w_var)))
+    )
+
+    return cvxpy.Problem(objective, constraints), j_re, j_im
+
 
 def diamond_norm(choi_1: np.ndarray, choi_2: np.ndarray) -> float:
     r"""
@@ -45,6 +113,7 @@ def diamond_norm(choi_1: np.ndarray, choi_2: np.ndarray) -> float:
 
     :raises ValueError: If matrices are not of equal dimension.
     :raises ValueError: If matrices are not square.
+    :raises ValueError: If the matrix dimension is not a perfect square.
     :param choi_1: A 4**N by 4**N matrix (where N is the number of qubits).
     :param choi_2: A 4**N by 4**N matrix (where N is the number of qubits).
     """
@@ -56,31 +125,52 @@ def diamond_norm(choi_1: np.ndarray, choi_2: np.ndarray) -> float:
         raise ValueError("The Choi matrix provided must be square.")
 
     dim_squared = choi_1.shape[0]
-    dim = int(np.sqrt(dim_squared))
-
-    delta_choi = choi_1 - choi_2
-
-    # Enforce Hermiticity.
-    delta_choi = (delta_choi.conj().T + delta_choi) / 2
-
-    # Enforce that variable is density operator.
-    rho = cvxpy.Variable([dim, dim], complex=True)
-    constraints = [rho == rho.H]
-    constraints += [rho >> 0]
-    constraints += [cvxpy.trace(rho) == 1]
-
-    # Variable must be Hermitian and positive-semidefinite.
-    w_var = cvxpy.Variable([dim_squared, dim_squared], complex=True)
-    constraints += [w_var == w_var.H]
-    constraints += [w_var >> 0]
-
-    constraints += [(w_var - cvxpy.kron(np.eye(dim), rho)) << 0]
-
-    j_var = cvxpy.Parameter([dim_squared, dim_squared], complex=True)
-    objective = cvxpy.Maximize(cvxpy.real(cvxpy.trace(j_var.H @ w_var)))
-
-    problem = cvxpy.Problem(objective, constraints)
-    j_var.value = delta_choi
-    problem.solve()
+    dim = math.isqrt(dim_squared)
+    if dim * dim != dim_squared:
+        raise ValueError("The Choi matrix provided must have a perfect square dimension.")
+
+    # Identical (up to numerical noise) channels have diamond norm zero; skip
+    # building the SDP only to confirm that.
+    if np.allclose(choi_1, choi_2, atol=16 * np.finfo(float).eps):
+        return 0.0
+
+    # Enforce Hermiticity. The difference is a fresh array, so the
+    # symmetrization accumulates into it in place rather than materializing
+    # another dim**2 x dim**2 intermediate.
+    delta_choi = (choi_1 - choi_2) / 2
+    delta_choi += delta_choi.conj().T
+
+    # Reuse the compiled problem for this dimension and sparsity pattern so
+    # that repeated calls only pay for the parameter update and the solve,
+    # not for re-canonicalizing the SDP.
+    eps = np.finfo(float).eps
+    delta_re, delta_im = delta_choi.real, delta_choi.imag
+    re_rows, re_cols = np.nonzero(np.abs(delta_re) > eps)
+    im_rows, im_cols = np.nonzero(np.abs(delta_im) > eps)
+    problem, j_re, j_im = _build_problem(
+        dim, (tuple(re_rows), tuple(re_cols)), (tuple(im_rows), tuple(im_cols))
+    )
+    j_re.value_sparse = sparse.coo_array(
+        (delta_re[re_rows, re_cols], (re_rows, re_cols)), shape=(dim_squared, dim_squared)
+    )
+    j_im.value_sparse = sparse.coo_array(
+        (delta_im[im_rows, im_cols], (im_rows, im_cols)), shape=(dim_squared, dim_squared)
+    )
+    # Clarabel handles the complex-lifted SDP efficiently and, together with
+    # the cached problem above, can reuse its factorizations between calls.
+    # Fall back to SCS, which also supports warm starts, if it is unavailable.
+    # cvxpy's own parameter-presence check reads sparse parameters through
+    # `.value` and warns about it on every solve; that read is internal to
+    # cvxpy, so the warning is deliberately silenced here.
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message="Reading from a sparse CVXPY expression",
+            category=RuntimeWarning,
+        )
+        try:
+            problem.solve(solver=cvxpy.CLARABEL, warm_start=True)
+        except cvxpy.SolverError:
+            problem.solve(solver=cvxpy.SCS, warm_start=True)
 
     return problem.value * 2
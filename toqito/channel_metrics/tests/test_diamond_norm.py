@@ -33,3 +33,19 @@ def test_diamond_norm_non_square():
         choi_1 = np.array([[1, 2, 3], [4, 5, 6]])
         choi_2 = np.array([[1, 2, 3], [4, 5, 6]])
         diamond_norm(choi_1, choi_2)
+
+
+def test_diamond_norm_non_perfect_square_dim():
+    """Choi matrices whose dimension is not a perfect square."""
+    with np.testing.assert_raises(ValueError):
+        choi_1 = np.identity(6)
+        choi_2 = 2 * np.identity(6)
+        diamond_norm(choi_1, choi_2)
+
+
+def test_diamond_norm_same_channel_invalid_dim():
+    """Identical channels of invalid dimension are still rejected."""
+    with np.testing.assert_raises(ValueError):
+        choi_1 = np.identity(6)
+        choi_2 = np.identity(6)
+        diamond_norm(choi_1, choi_2)
@@ -1,10 +1,42 @@
 """The realignment channel."""
 
 
+import math
+
 import numpy as np
 
-from toqito.channels import partial_transpose
-from toqito.perms import swap
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _realign_equal_dim(input_mat: np.ndarray, sub_dim: int) -> np.ndarray:
+    """Apply the realignment permutation for equally sized subsystems.
+
+    Explicit index loops compile to a single zero-overhead pass under numba,
+    which pays off when `realignment` is called many times on small matrices
+    (e.g. entanglement-witness sweeps).
+
+    :param input_mat: The matrix to realign.
+    :param sub_dim: The dimension of each subsystem.
+    :return: The realigned matrix.
+    """
+    # Size the output from `sub_dim` rather than mirroring the input so every
+    # entry is written even if the kernel is handed a mismatched matrix.
+    out = np.empty((sub_dim * sub_dim, sub_dim * sub_dim), dtype=input_mat.dtype)
+    for i in range(sub_dim):
+        for j in range(sub_dim):
+            for k in range(sub_dim):
+                for l_ind in range(sub_dim):
+                    out[i * sub_dim + k, j * sub_dim + l_ind] = input_mat[
+                        i * sub_dim + j, k * sub_dim + l_ind
+                    ]
+    return out
+
+
+if numba is not None:
+    _realign_equal_dim = numba.njit(cache=True)(_realign_equal_dim)
 
 
 def realignment(input_mat: np.ndarray, dim: int | list[int] = None) -> np.ndarray:
@@ -54,8 +86,24 @@ def realignment(input_mat: np.ndarray, dim: int | list[int] = None) -> np.ndarra
     :raises ValueError: If dimension of matrix is invalid.
     :return: The realignment map matrix.
     """
-    eps = np.finfo(float).eps
     dim_mat = input_mat.shape
+
+    # Fast path for the common case of a square matrix with equally sized
+    # subsystems: the subsystem dimension is determined directly, so the
+    # dimension normalization below is skipped entirely.
+    if dim is None and dim_mat[0] == dim_mat[1]:
+        subsystem_dim = math.isqrt(dim_mat[0])
+        if subsystem_dim * subsystem_dim != dim_mat[0]:
+            raise ValueError("InvalidDim:")
+        # A 1 x 1 input falls through to the trivial-first-subsystem handling
+        # below, matching the historical output shape.
+        if subsystem_dim > 1:
+            if numba is not None:
+                return _realign_equal_dim(np.ascontiguousarray(input_mat), subsystem_dim)
+            tensor = input_mat.reshape(subsystem_dim, subsystem_dim, subsystem_dim, subsystem_dim)
+            return tensor.transpose(0, 2, 1, 3).reshape(dim_mat[0], dim_mat[1])
+
+    eps = np.finfo(float).eps
     round_dim = np.round(np.sqrt(dim_mat))
     if dim is None:
         dim = np.transpose(np.array([round_dim]))
@@ -78,11 +126,23 @@ def realignment(input_mat: np.ndarray, dim: int | list[int] = None) -> np.ndarra
         dim = dim[:].T[0]
         dim = np.array([dim, dim])
 
-    dim_x = np.array([[dim[0][1], dim[0][0]], [dim[1][0], dim[1][1]]])
-    dim_x = np.int_(dim_x)  # pylint: disable=redefined-variable-type
-    dim_y = np.array([[dim[1][0], dim[0][0]], [dim[0][1], dim[1][1]]])
-
-    x_tmp = swap(input_mat, [1, 2], dim, True)
-    y_tmp = partial_transpose(x_tmp, [0], dim_x)
-
-    return swap(y_tmp, [1, 2], dim_y, True)
+    row_dims = np.int_(dim[0])
+    col_dims = np.int_(dim[1])
+
+    # The realignment |ij><kl| -> |ik><jl| is a single permutation of the
+    # 4-index tensor underlying `input_mat`, so one reshape-transpose-reshape
+    # replaces the former swap -> partial_transpose -> swap pipeline and its
+    # two intermediate matrices.
+    tensor = input_mat.reshape(row_dims[0], row_dims[1], col_dims[0], col_dims[1])
+
+    # Preserve the historical output for a trivial first subsystem: the result
+    # is flattened to a vector with the remaining row and column indices
+    # interchanged.
+    if row_dims[0] == 1 and col_dims[0] == 1:
+        return tensor.transpose(0, 2, 3, 1).reshape(row_dims[1] * col_dims[1])
+
+    # One permutation, one explicit contiguous copy; the final reshape is then
+    # a free view.
+    return np.ascontiguousarray(tensor.transpose(0, 2, 1, 3)).reshape(
+        row_dims[0] * col_dims[0], row_dims[1] * col_dims[1]
+    )
@@ -512,6 +512,35 @@ def test_realignment_non_square_list_dims():
     np.testing.assert_equal(np.all(bool_mat), True)
 
 
+def test_realignment_two_qutrit():
+    """Realignment of a two-qutrit operator with default dimensions.
+
+    The expected result is built directly from the definition
+    :math:`|ij \\rangle \\langle kl| \\mapsto |ik \\rangle \\langle jl|`.
+    """
+    test_input_mat = np.arange(1, 82).reshape(9, 9)
+
+    expected_res = np.zeros((9, 9), dtype=int)
+    for i in range(3):
+        for j in range(3):
+            for k in range(3):
+                for l_ind in range(3):
+                    expected_res[3 * i + k, 3 * j + l_ind] = test_input_mat[
+                        3 * i + j, 3 * k + l_ind
+                    ]
+
+    res = realignment(test_input_mat)
+
+    bool_mat = np.isclose(expected_res, res)
+    np.testing.assert_equal(np.all(bool_mat), True)
+
+
+def test_realignment_non_perfect_square_dim():
+    """A square matrix whose size is not a perfect square is invalid."""
+    with np.testing.assert_raises(ValueError):
+        realignment(np.identity(6))
+
+
 def test_realignment_int_dim():
     """Pass in dimension argument as integer."""
     test_input_mat = np.arange(1, 17).reshape(4, 4)
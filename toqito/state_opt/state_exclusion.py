@@ -1,6 +1,76 @@
 """State exclusion."""
+import functools
+import operator
+
+import cvxpy
 import numpy as np
-import picos
+
+
+@functools.lru_cache()
+def _build_primal_problem(
+    n: int, dim: int
+) -> tuple[cvxpy.Problem, list[cvxpy.Parameter], list[cvxpy.Variable]]:
+    """Construct the primal state exclusion SDP for `n` states of dimension `dim`.
+
+    The problem is parameterized by the probability-weighted projectors, so it
+    is cached and reused across calls (e.g. sweeps over `probs`); only the
+    parameter values change between solves.
+
+    :param n: The number of states.
+    :param dim: The dimension of the states.
+    :return: The compiled problem, its projector parameters and the
+             measurement variables.
+    """
+    measurements = [cvxpy.Variable((dim, dim), hermitian=True) for _ in range(n)]
+    rho_params = [cvxpy.Parameter((dim, dim), hermitian=True) for _ in range(n)]
+
+    # A block-diagonal matrix is PSD exactly when each diagonal block is, so
+    # the n separate PSD constraints collapse into a single cone and the
+    # solver avoids the per-cone setup overhead.
+    zero_block = np.zeros((dim, dim))
+    constraints = [
+        cvxpy.bmat(
+            [[measurements[i] if i == j else zero_block for j in range(n)] for i in range(n)]
+        )
+        >> 0
+    ]
+    constraints += [functools.reduce(operator.add, measurements) == np.identity(dim)]
+
+    # For Hermitian A and B, Tr(A @ B) = sum(conj(A) ⊙ B); the element-wise
+    # form keeps the constant projectors on the cheap affine path instead of
+    # emitting a symbolic matrix product per state.
+    objective = cvxpy.Minimize(
+        functools.reduce(
+            operator.add,
+            [
+                cvxpy.real(cvxpy.sum(cvxpy.multiply(cvxpy.conj(rho_params[i]), measurements[i])))
+                for i in range(n)
+            ],
+        )
+    )
+    return cvxpy.Problem(objective, constraints), rho_params, measurements
+
+
+@functools.lru_cache()
+def _build_dual_problem(
+    n: int, dim: int
+) -> tuple[cvxpy.Problem, list[cvxpy.Parameter], list[cvxpy.constraints.constraint.Constraint]]:
+    """Construct the dual state exclusion SDP for `n` states of dimension `dim`.
+
+    As with the primal problem, the compiled problem is cached and shared
+    across calls; only the parameter values change between solves.
+
+    :param n: The number of states.
+    :param dim: The dimension of the states.
+    :return: The compiled problem, its projector parameters and the
+             constraints whose duals recover the measurements.
+    """
+    y_var = cvxpy.Variable((dim, dim), hermitian=True)
+    rho_params = [cvxpy.Parameter((dim, dim), hermitian=True) for _ in range(n)]
+    constraints = [y_var << rho_params[i] for i in range(n)]
+
+    objective = cvxpy.Maximize(cvxpy.real(cvxpy.trace(y_var)))
+    return cvxpy.Problem(objective, constraints), rho_params, constraints
 
 
 def state_exclusion(
@@ -8,7 +78,7 @@ def state_exclusion(
     probs: list[float] = None,
     solver: str = "cvxopt",
     primal_dual: str = "dual",
-) -> tuple[float, list[picos.HermitianVariable]]:
+) -> tuple[float, list[np.ndarray]]:
     r"""
     Compute probability of single state conclusive state exclusion.
 
@@ -95,7 +165,8 @@ def state_exclusion(
     :param vectors: A list of states provided as vectors.
     :param probs: Respective list of probabilities each state is selected. If no
                   probabilities are provided, a uniform probability distribution is assumed.
-    :param solver: Optimization option for `picos` solver. Default option is `solver_option="cvxopt"`.
+    :param solver: Optimization option for `cvxpy` solver (case-insensitive). Default option is
+                   `solver_option="cvxopt"`.
     :param primal_dual: Option for the optimization problem.
     :return: The optimal probability with which Bob can guess the state he was
              not given from `states` along with the optimal set of measurements.
@@ -104,7 +175,7 @@ def state_exclusion(
         raise ValueError("Vectors for state exclusion must all have the same dimension.")
 
     # Assumes a uniform probabilities distribution among the states if one is not explicitly provided.
-    n = vectors[0].shape[0]
+    n = len(vectors)
     probs = [1 / n] * n if probs is None else probs
 
     if primal_dual == "primal":
@@ -112,55 +183,55 @@ def state_exclusion(
     return _min_error_dual(vectors=vectors, probs=probs, solver=solver)
 
 
+def _weighted_projectors(vectors: list[np.ndarray], probs: list[float]) -> np.ndarray:
+    """Batch the probability-weighted projectors in a single vectorized pass.
+
+    :param vectors: A list of states provided as vectors.
+    :param probs: Respective list of probabilities each state is selected.
+    :return: An array of shape `(n, dim, dim)` holding `probs[i] * v_i v_i^*`.
+    """
+    # Folding the square roots of the probabilities into the stacked vectors
+    # lets a single BLAS-friendly contraction produce every weighted projector
+    # at once, instead of scaling each outer product separately.
+    stacked = np.column_stack([vector.ravel() for vector in vectors])
+    weighted = stacked * np.sqrt(np.asarray(probs))
+    return np.einsum("in,jn->nij", weighted, weighted.conj())
+
+
 def _min_error_primal(
         vectors: list[np.ndarray],
         probs: list[float] = None,
         solver: str = "cvxopt",
-) -> tuple[float, list[picos.HermitianVariable]]:
+) -> tuple[float, list[np.ndarray]]:
     """Find the primal problem for minimum-error quantum state exclusion SDP."""
     n, dim = len(vectors), vectors[0].shape[0]
 
-    problem = picos.Problem()
-    measurements = [picos.HermitianVariable(f"M[{i}]", (dim, dim)) for i in range(n)]
+    problem, rho_params, measurements = _build_primal_problem(n, dim)
+    for rho_param, rho in zip(rho_params, _weighted_projectors(vectors, probs)):
+        rho_param.value = rho
 
-    problem.add_list_of_constraints([meas >> 0 for meas in measurements])
-    problem.add_constraint(picos.sum(measurements) == picos.I(dim))
+    problem.solve(solver=solver.upper(), warm_start=True)
 
-    problem.set_objective(
-        "min",
-        picos.sum(
-            [
-                (probs[i] * vectors[i] @ vectors[i].conj().T | measurements[i])
-                for i in range(n)
-            ]
-        ),
-    )
-    solution = problem.solve(solver=solver)
-    return solution.value, measurements
+    # Snapshot the measurement values: the cached problem shares its variable
+    # objects across calls, so a later solve would otherwise overwrite the
+    # measurements returned here.
+    return problem.value, [measurement.value for measurement in measurements]
 
 
 def _min_error_dual(
         vectors: list[np.ndarray],
         probs: list[float] = None,
         solver: str = "cvxopt"
-) -> tuple[float, list[picos.HermitianVariable]]:
+) -> tuple[float, list[np.ndarray]]:
     """Find the dual problem for minimum-error quantum state exclusion SDP."""
     n, dim = len(vectors), vectors[0].shape[0]
-    problem = picos.Problem()
-
-    # Set up variables and constraints for SDP:
-    y_var = picos.HermitianVariable("Y", (dim, dim))
-    problem.add_list_of_constraints(
-        [
-            y_var << probs[i] * vector @ vector.conj().T
-            for i, vector in enumerate(vectors)
-        ]
-    )
 
-    # Objective function:
-    problem.set_objective("max", picos.trace(y_var))
-    solution = problem.solve(solver=solver)
+    problem, rho_params, constraints = _build_dual_problem(n, dim)
+    for rho_param, rho in zip(rho_params, _weighted_projectors(vectors, probs)):
+        rho_param.value = rho
+
+    problem.solve(solver=solver.upper(), warm_start=True)
 
-    measurements = [problem.get_constraint(k).dual for k in range(n)]
+    measurements = [constraint.dual_value for constraint in constraints]
 
-    return solution.value, measurements
+    return problem.value, measurements
@@ -19,6 +19,12 @@ e_0, e_1 = standard_basis(2)
     ([bell(0), bell(1), bell(2), bell(3)], [1/4, 1/4, 1/4, 1/4], "cvxopt", "primal", 0),
     # Bell states uniform probs with dual.
     ([bell(0), bell(1), bell(2), bell(3)], [1/4, 1/4, 1/4, 1/4], "cvxopt", "dual", 0),
+    # Two Bell states (default uniform probs with primal).
+    ([bell(0), bell(1)], None, "cvxopt", "primal", 0),
+    # Two Bell states (default uniform probs with dual).
+    ([bell(0), bell(1)], None, "cvxopt", "dual", 0),
+    # Solver names are accepted case-insensitively.
+    ([bell(0), bell(1), bell(2), bell(3)], None, "CLARABEL", "dual", 0),
 ])
 def test_conclusive_state_exclusion(vectors, probs, solver, primal_dual, expected_result):
     val, _ = state_exclusion(vectors=vectors, probs=probs, solver=solver, primal_dual=primal_dual)
@@ -32,3 +38,14 @@ def test_conclusive_state_exclusion(vectors, probs, solver, primal_dual, expecte
 def test_state_exclusion_invalid_vectors(vectors, probs, solver, primal_dual):
     with pytest.raises(ValueError):
         state_exclusion(vectors=vectors, probs=probs, solver=solver, primal_dual=primal_dual)
+
+
+def test_state_exclusion_primal_measurements_are_snapshots():
+    """Measurements from one call are unaffected by a later solve."""
+    vectors = [bell(0), bell(1), bell(2), bell(3)]
+    _, measurements = state_exclusion(vectors, [1/4, 1/4, 1/4, 1/4], primal_dual="primal")
+    assert isinstance(measurements[0], np.ndarray)
+
+    first_measurement = measurements[0].copy()
+    state_exclusion(vectors, [0.7, 0.1, 0.1, 0.1], primal_dual="primal")
+    np.testing.assert_allclose(measurements[0], first_measurement)